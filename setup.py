@@ -1,15 +1,24 @@
 """
 Setup script for the Terraform Plan Analyzer.
 """
+import os
+
 from setuptools import setup, find_packages
 
+# Set TF_PLAN_ANALYZER_MYPYC=1 to compile the recommendation engine with mypyc
+ext_modules = []
+if os.environ.get('TF_PLAN_ANALYZER_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['src/recommender/engine.py'])
+
 setup(
     name="terraform-plan-analyzer",
     version="0.1.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "terraform-plan-analyzer=src.cli:main",
         ],
     },
-)
\ No newline at end of file
+)
@@ -11,12 +11,13 @@ from src.formatter.response_formatter import ResponseFormatter
 from src.models import AnalysisResponse, ResponseStatus
 
 
-def analyze_terraform_plan(plan_output: str) -> str:
+def analyze_terraform_plan(plan_output: str, pretty: bool = True) -> str:
     """
     Analyze a Terraform plan output and provide recommendations.
     
     Args:
         plan_output: Raw Terraform plan output as a string
+        pretty: Indent the JSON output when True, emit compact JSON otherwise
         
     Returns:
         JSON string with analysis results and recommendations
@@ -29,7 +30,7 @@ def analyze_terraform_plan(plan_output: str) -> str:
     # If no errors detected and we have resource counts, return success
     if not error_contexts:
         formatter = ResponseFormatter([], resource_counts)
-        return formatter.format_response()
+        return formatter.format_response(pretty=pretty)
     
     # 2. Detect and classify errors
     detector = ErrorDetector(error_contexts)
@@ -38,7 +39,7 @@ def analyze_terraform_plan(plan_output: str) -> str:
     # If no errors could be detected from the contexts, return unknown
     if not errors:
         formatter = ResponseFormatter([], resource_counts)
-        return formatter.format_response()
+        return formatter.format_response(pretty=pretty)
     
     # 3. Generate recommendations for errors
     recommender = RecommendationEngine(errors)
@@ -46,7 +47,7 @@ def analyze_terraform_plan(plan_output: str) -> str:
     
     # 4. Format the response
     formatter = ResponseFormatter(errors_with_recommendations, resource_counts)
-    return formatter.format_response()
+    return formatter.format_response(pretty=pretty)
 
 
 def parse_json_response(json_str: str) -> Dict[str, Any]:
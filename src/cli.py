@@ -3,10 +3,9 @@ Command-line interface for the Terraform plan analyzer.
 """
 import argparse
 import sys
-import json
 from typing import Optional
 
-from src.agent import analyze_terraform_plan, parse_json_response
+from src.agent import analyze_terraform_plan
 
 
 def main():
@@ -31,41 +30,39 @@ def main():
     )
     args = parser.parse_args()
     
-    # Read plan output from file or stdin
+    # Read plan output from file or stdin as raw bytes and decode once;
+    # the parser handles any newline style itself
     if args.file:
         try:
-            with open(args.file, 'r') as f:
-                plan_output = f.read()
+            with open(args.file, 'rb') as f:
+                plan_output = f.read().decode('utf-8')
         except Exception as e:
             print(f"Error reading file: {e}", file=sys.stderr)
             sys.exit(1)
     else:
         # Read from stdin
-        plan_output = sys.stdin.read()
-    
-    # Analyze the plan
-    result = analyze_terraform_plan(plan_output)
-    
-    # Pretty print if requested
-    if args.pretty:
         try:
-            parsed = json.loads(result)
-            result = json.dumps(parsed, indent=2)
-        except:
-            # If parsing fails, use the original result
-            pass
+            plan_output = sys.stdin.buffer.read().decode('utf-8')
+        except UnicodeDecodeError as e:
+            print(f"Error reading input: {e}", file=sys.stderr)
+            sys.exit(1)
+    
+    # Analyze the plan, letting the formatter handle pretty printing
+    result = analyze_terraform_plan(plan_output, pretty=args.pretty)
     
     # Output to file or stdout
+    output = result.encode('utf-8')
     if args.output:
         try:
-            with open(args.output, 'w') as f:
-                f.write(result)
+            with open(args.output, 'wb') as f:
+                f.write(output)
         except Exception as e:
             print(f"Error writing to output file: {e}", file=sys.stderr)
             sys.exit(1)
     else:
-        # Print to stdout
-        print(result)
+        # Write to stdout in one call
+        sys.stdout.buffer.write(output + b'\n')
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,138 @@
 """
 Error detection module for Terraform plan output.
 """
+import json
+import os
 import re
-from typing import Dict, List, Optional
+import sys
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple
 
-from src.models import Error, ErrorType, AffectedResource
+from src.models import Error, ErrorContext, ErrorType, AffectedResource
+
+try:
+    import hyperscan  # type: ignore[import-not-found]
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
+
+_ERROR_PREFIX_RE = re.compile(r'Error:\s+')
+_VALIDATION_RE = re.compile(r'(.*?)(expected|required|must|invalid)(.+)')
+
+# Lead-in for humanized messages of each error type
+_MESSAGE_PREFIXES = {
+    ErrorType.PERMISSION: "You don't have sufficient permissions: ",
+    ErrorType.DEPENDENCY: "There's a dependency issue: ",
+    ErrorType.SYNTAX: "There's a syntax error in your configuration: ",
+    ErrorType.RESOURCE_CONFLICT: "Resource conflict detected: ",
+    ErrorType.STATE_MISMATCH: "The Terraform state doesn't match the actual infrastructure: ",
+    ErrorType.PROVIDER: "There's an issue with the provider configuration: ",
+    ErrorType.MODULE: "There's an issue with a module: ",
+}
+
+# Environment variable naming a JSON file that collects pattern hit counts
+PATTERN_STATS_ENV = 'TF_PLAN_ANALYZER_PATTERN_STATS'
+
+# Characters that make a pattern more than a plain substring search
+_REGEX_METACHARACTERS = set('.^$*+?{}[]\\|()')
+
+# (priority in ERROR_PATTERNS, pattern, error type)
+PatternEntry = Tuple[int, str, ErrorType]
+
+
+def _split_patterns(patterns: List[Tuple[str, ErrorType]]) -> Tuple[List[PatternEntry], List[PatternEntry]]:
+    """
+    Separate plain keyword patterns from real regular expressions.
+    
+    Args:
+        patterns: (pattern, error type) pairs in priority order
+        
+    Returns:
+        Tuple of (keywords, regexes); keywords are lowercased for matching
+        against a lowercased message
+    """
+    keywords = []
+    regexes = []
+    for index, (pattern, error_type) in enumerate(patterns):
+        if _REGEX_METACHARACTERS.isdisjoint(pattern):
+            keywords.append((index, pattern.lower(), error_type))
+        else:
+            regexes.append((index, pattern, error_type))
+    return keywords, regexes
+
+
+def _build_keyword_matcher(keywords: List[PatternEntry], no_match: int) -> Callable[[str], int]:
+    """
+    Generate a function that returns the priority of the first matching keyword.
+    
+    The keyword table is static, so it is unrolled into straight-line
+    ``if keyword in message`` checks instead of looping over tuples.
+    
+    Args:
+        keywords: Lowercased keyword entries in priority order
+        no_match: Value returned when no keyword is found
+        
+    Returns:
+        Function taking a lowercased message and returning a priority index
+    """
+    lines = ['def first_keyword(lowered):']
+    for index, keyword, _ in keywords:
+        lines.append(f'    if {keyword!r} in lowered:')
+        lines.append(f'        return {index}')
+    lines.append(f'    return {no_match}')
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile('\n'.join(lines), '<error-keyword-matcher>', 'exec'), namespace)
+    return namespace['first_keyword']
+
+
+def _build_classifier(patterns: List[PatternEntry]) -> re.Pattern:
+    """
+    Fuse the classification regexes into a single regex.
+    
+    Each pattern becomes a named lookahead anchored at the start of the
+    message, so alternatives are tried in declaration order and the first
+    matching pattern wins, exactly like a sequential scan. The regex runs on
+    the lowercased message, so patterns must be written in lower case.
+    
+    Args:
+        patterns: Pattern entries in priority order
+        
+    Returns:
+        Compiled regex whose ``lastgroup`` names the matching pattern
+    """
+    branches = [
+        f'(?=(?s:.*?)(?P<p{index}>{pattern}))'
+        for index, pattern, _ in patterns
+    ]
+    return re.compile(r'\A(?:' + '|'.join(branches) + ')')
+
+
+def _build_hyperscan_database(patterns: List[Tuple[str, ErrorType]]):
+    """
+    Compile the classification patterns into a Hyperscan database.
+    
+    Pattern ids are the declaration indexes, so the lowest reported id is the
+    pattern that a sequential scan would have matched first.
+    
+    Args:
+        patterns: (pattern, error type) pairs in priority order
+        
+    Returns:
+        A compiled hyperscan.Database, or None if Hyperscan is not installed
+    """
+    if hyperscan is None:
+        return None
+    
+    expressions = [pattern.encode('utf-8') for pattern, _ in patterns]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+    )
+    return database
 
 
 class ErrorDetector:
@@ -12,66 +140,84 @@ class ErrorDetector:
     Detects and classifies errors in Terraform plan output.
     """
     
-    # Error pattern to type mapping
-    ERROR_PATTERNS = {
+    # Error patterns and their types, in priority order: the first pattern
+    # that matches a message decides its type. Patterns are matched
+    # case-insensitively and must be written in lower case. Set PATTERN_STATS_ENV to
+    # collect hit counts before reordering entries.
+    ERROR_PATTERNS = [
         # Validation errors
-        r'validation failed': ErrorType.VALIDATION,
-        r'expected\s+.*\s+but\s+got': ErrorType.VALIDATION,
-        r'required field is not set': ErrorType.VALIDATION,
-        r'value must be one of': ErrorType.VALIDATION,
-        r'must contain at least': ErrorType.VALIDATION,
-        r'invalid value': ErrorType.VALIDATION,
+        (r'validation failed', ErrorType.VALIDATION),
+        (r'expected\s+.*\s+but\s+got', ErrorType.VALIDATION),
+        (r'required field is not set', ErrorType.VALIDATION),
+        (r'value must be one of', ErrorType.VALIDATION),
+        (r'must contain at least', ErrorType.VALIDATION),
+        (r'invalid value', ErrorType.VALIDATION),
         
         # Dependency errors
-        r'unknown resource': ErrorType.DEPENDENCY,
-        r'depends on resource': ErrorType.DEPENDENCY,
-        r'referenced by': ErrorType.DEPENDENCY,
-        r'cyclic dependency': ErrorType.DEPENDENCY,
-        r'cannot resolve': ErrorType.DEPENDENCY,
+        (r'unknown resource', ErrorType.DEPENDENCY),
+        (r'depends on resource', ErrorType.DEPENDENCY),
+        (r'referenced by', ErrorType.DEPENDENCY),
+        (r'cyclic dependency', ErrorType.DEPENDENCY),
+        (r'cannot resolve', ErrorType.DEPENDENCY),
         
         # Permission errors
-        r'access denied': ErrorType.PERMISSION,
-        r'not authorized': ErrorType.PERMISSION,
-        r'permission denied': ErrorType.PERMISSION,
-        r'credentials': ErrorType.PERMISSION,
-        r'authentication': ErrorType.PERMISSION,
-        r'forbidden': ErrorType.PERMISSION,
+        (r'access denied', ErrorType.PERMISSION),
+        (r'not authorized', ErrorType.PERMISSION),
+        (r'permission denied', ErrorType.PERMISSION),
+        (r'credentials', ErrorType.PERMISSION),
+        (r'authentication', ErrorType.PERMISSION),
+        (r'forbidden', ErrorType.PERMISSION),
         
         # Syntax errors
-        r'syntax error': ErrorType.SYNTAX,
-        r'expected ["\(]': ErrorType.SYNTAX,
-        r'unexpected ["\)]': ErrorType.SYNTAX,
-        r'invalid block definition': ErrorType.SYNTAX,
+        (r'syntax error', ErrorType.SYNTAX),
+        (r'expected ["\(]', ErrorType.SYNTAX),
+        (r'unexpected ["\)]', ErrorType.SYNTAX),
+        (r'invalid block definition', ErrorType.SYNTAX),
         
         # Resource conflicts
-        r'already exists': ErrorType.RESOURCE_CONFLICT,
-        r'conflicts with': ErrorType.RESOURCE_CONFLICT,
-        r'duplicate': ErrorType.RESOURCE_CONFLICT,
-        r'in use': ErrorType.RESOURCE_CONFLICT,
+        (r'already exists', ErrorType.RESOURCE_CONFLICT),
+        (r'conflicts with', ErrorType.RESOURCE_CONFLICT),
+        (r'duplicate', ErrorType.RESOURCE_CONFLICT),
+        (r'in use', ErrorType.RESOURCE_CONFLICT),
         
         # State mismatch
-        r'state is out of date': ErrorType.STATE_MISMATCH,
-        r'does not match': ErrorType.STATE_MISMATCH,
-        r'importing': ErrorType.STATE_MISMATCH,
-        r'drift detected': ErrorType.STATE_MISMATCH,
+        (r'state is out of date', ErrorType.STATE_MISMATCH),
+        (r'does not match', ErrorType.STATE_MISMATCH),
+        (r'importing', ErrorType.STATE_MISMATCH),
+        (r'drift detected', ErrorType.STATE_MISMATCH),
         
         # Provider errors
-        r'provider': ErrorType.PROVIDER,
-        r'plugin': ErrorType.PROVIDER,
-        r'registry.terraform.io': ErrorType.PROVIDER,
+        (r'provider', ErrorType.PROVIDER),
+        (r'plugin', ErrorType.PROVIDER),
+        (r'registry.terraform.io', ErrorType.PROVIDER),
         
         # Module errors
-        r'module': ErrorType.MODULE,
-        r'source': ErrorType.MODULE,
-        r'version constraint': ErrorType.MODULE,
+        (r'module', ErrorType.MODULE),
+        (r'source', ErrorType.MODULE),
+        (r'version constraint', ErrorType.MODULE),
+    ]
+
+    # Plain keywords are checked with substring tests; the remaining patterns
+    # are fused into one regex. Both keep their ERROR_PATTERNS priority.
+    _KEYWORD_PATTERNS, _REGEX_PATTERNS = _split_patterns(ERROR_PATTERNS)
+    _first_keyword = staticmethod(_build_keyword_matcher(_KEYWORD_PATTERNS, len(ERROR_PATTERNS)))
+    _CLASSIFIER = _build_classifier(_REGEX_PATTERNS)
+    _CLASSIFIER_GROUPS = {
+        f'p{index}': (index, error_type) for index, _, error_type in _REGEX_PATTERNS
     }
     
-    def __init__(self, error_contexts: List[Dict[str, str]]):
+    # Error type by pattern priority; one past the end means no match
+    _PATTERN_TYPES = [error_type for _, error_type in ERROR_PATTERNS] + [ErrorType.OTHER]
+    
+    # Optional DFA engine used instead of _CLASSIFIER when Hyperscan is installed
+    _HS_DATABASE = _build_hyperscan_database(ERROR_PATTERNS)
+    
+    def __init__(self, error_contexts: List[ErrorContext]):
         """
         Initialize the error detector with error contexts from the parser.
         
         Args:
-            error_contexts: List of error context dictionaries from the parser
+            error_contexts: List of ErrorContext tuples from the parser
         """
         self.error_contexts = error_contexts
     
@@ -82,29 +228,50 @@ class ErrorDetector:
         Returns:
             List of Error objects with detected errors
         """
-        errors = []
+        # Keep each message's pattern index so statistics need no second scan
+        pattern_indexes = [self._match_pattern(context.message) for context in self.error_contexts]
+        errors = [
+            self._build_error(context, index)
+            for context, index in zip(self.error_contexts, pattern_indexes)
+        ]
+        
+        stats_path = os.environ.get(PATTERN_STATS_ENV)
+        if stats_path:
+            self._record_pattern_hits(stats_path, pattern_indexes)
         
-        for context in self.error_contexts:
-            error_type = self._classify_error_type(context['message'])
-            
-            affected_resource = None
-            if context.get('resource_type') and context.get('resource_name'):
-                affected_resource = AffectedResource(
-                    name=context['resource_name'],
-                    type=context['resource_type'],
-                    address=f"{context['resource_type']}.{context['resource_name']}"
-                )
-            
-            error = Error(
-                errorType=error_type,
-                message=self._humanize_error_message(context['message'], error_type),
-                affectedResources=[affected_resource] if affected_resource else []
-            )
-            
-            errors.append(error)
-            
         return errors
     
+    def _build_error(self, context: ErrorContext, pattern_index: int) -> Error:
+        """
+        Build a classified Error from a single error context.
+        
+        Args:
+            context: ErrorContext from the parser
+            pattern_index: Index of the pattern matching the message, as
+                returned by _match_pattern
+            
+        Returns:
+            Error object with type, humanized message and affected resources
+        """
+        error_type = self._PATTERN_TYPES[pattern_index]
+        
+        # Built from parser output we already trust, so skip validation
+        affected_resources = []
+        resource_type = context.resource_type
+        resource_name = context.resource_name
+        if resource_type and resource_name:
+            affected_resources.append(AffectedResource.model_construct(
+                name=resource_name,
+                type=resource_type,
+                address=f"{resource_type}.{resource_name}"
+            ))
+        
+        return Error.model_construct(
+            errorType=error_type,
+            message=self._humanize_error_message(context.message, error_type),
+            affectedResources=affected_resources
+        )
+    
     def _classify_error_type(self, error_message: str) -> ErrorType:
         """
         Classify an error message into a specific error type.
@@ -115,11 +282,86 @@ class ErrorDetector:
         Returns:
             ErrorType enum value for the detected error type
         """
-        for pattern, error_type in self.ERROR_PATTERNS.items():
-            if re.search(pattern, error_message, re.IGNORECASE):
-                return error_type
+        return self._PATTERN_TYPES[self._match_pattern(error_message)]
+    
+    def _match_pattern(self, error_message: str) -> int:
+        """
+        Find the first pattern in ERROR_PATTERNS that matches a message.
+        
+        Args:
+            error_message: The raw error message
+            
+        Returns:
+            Index of the matching pattern, or len(ERROR_PATTERNS) if none match
+        """
+        if self._HS_DATABASE is not None:
+            return self._match_with_hyperscan(error_message)
+        
+        # Lowercase once instead of case-folding inside every pattern
+        lowered = error_message.lower()
+        best_index = self._first_keyword(lowered)
+        
+        # A regex only wins if it comes earlier in ERROR_PATTERNS
+        match = self._CLASSIFIER.match(lowered)
+        if match is not None and match.lastgroup is not None:
+            index, _ = self._CLASSIFIER_GROUPS[match.lastgroup]
+            if index < best_index:
+                return index
+        
+        return best_index
+    
+    def _match_with_hyperscan(self, error_message: str) -> int:
+        """
+        Find the first matching pattern in a single Hyperscan pass.
+        
+        Args:
+            error_message: The raw error message
+            
+        Returns:
+            Index of the matching pattern, or len(ERROR_PATTERNS) if none match
+        """
+        matched_ids = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched_ids.append(pattern_id)
+        
+        self._HS_DATABASE.scan(error_message.encode('utf-8'), match_event_handler=on_match)
+        
+        return min(matched_ids, default=len(self.ERROR_PATTERNS))
+    
+    def _record_pattern_hits(self, stats_path: str, pattern_indexes: List[int]) -> None:
+        """
+        Add this run's pattern hit counts to a JSON statistics file.
+        
+        Args:
+            stats_path: Path of the JSON file mapping pattern to hit count
+            pattern_indexes: Pattern index matched by each error message
+        """
+        hits: Counter[str] = Counter(
+            self.ERROR_PATTERNS[index][0]
+            for index in pattern_indexes
+            if index < len(self.ERROR_PATTERNS)
+        )
+        
+        # Statistics are diagnostic only, so an unreadable file counts as empty
+        try:
+            with open(stats_path, 'r') as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
         
-        return ErrorType.OTHER
+        # Ignore anything that is not a pattern-to-count mapping
+        if isinstance(previous, dict):
+            hits.update({
+                pattern: count for pattern, count in previous.items()
+                if isinstance(count, int)
+            })
+        
+        try:
+            with open(stats_path, 'w') as f:
+                json.dump(dict(hits.most_common()), f, indent=2)
+        except OSError as e:
+            print(f"Warning: could not write pattern statistics: {e}", file=sys.stderr)
     
     def _humanize_error_message(self, error_message: str, error_type: ErrorType) -> str:
         """
@@ -134,38 +376,21 @@ class ErrorDetector:
         """
         # Extract the most relevant part of the error message
         # Remove common prefixes and normalize whitespace
-        message = re.sub(r'Error:\s+', '', error_message)
-        message = re.sub(r'\s+', ' ', message).strip()
+        message = error_message
+        if 'Error:' in message:
+            message = _ERROR_PREFIX_RE.sub('', message)
+        message = ' '.join(message.split())
         
         # Make the message more human-friendly based on error type
         if error_type == ErrorType.VALIDATION:
             # Extract the key validation information
-            validation_info = re.search(r'(.*?)(expected|required|must|invalid)(.+)', message)
+            validation_info = _VALIDATION_RE.search(message)
             if validation_info:
                 field = validation_info.group(1).strip()
                 issue = validation_info.group(2).strip() + validation_info.group(3).strip()
                 return f"The value for '{field}' is invalid. {issue}."
-            
-        elif error_type == ErrorType.PERMISSION:
-            return f"You don't have sufficient permissions: {message}"
-            
-        elif error_type == ErrorType.DEPENDENCY:
-            return f"There's a dependency issue: {message}"
-            
-        elif error_type == ErrorType.SYNTAX:
-            return f"There's a syntax error in your configuration: {message}"
-            
-        elif error_type == ErrorType.RESOURCE_CONFLICT:
-            return f"Resource conflict detected: {message}"
-            
-        elif error_type == ErrorType.STATE_MISMATCH:
-            return f"The Terraform state doesn't match the actual infrastructure: {message}"
-        
-        elif error_type == ErrorType.PROVIDER:
-            return f"There's an issue with the provider configuration: {message}"
-            
-        elif error_type == ErrorType.MODULE:
-            return f"There's an issue with a module: {message}"
+            return message
         
-        # If no specific humanizing rule applies, return the cleaned message
-        return message
\ No newline at end of file
+        # Other types get a lead-in; unknown types keep the cleaned message
+        prefix = _MESSAGE_PREFIXES.get(error_type)
+        return prefix + message if prefix else message
\ No newline at end of file
@@ -2,10 +2,15 @@
 Response formatter for generating the final consolidated JSON output.
 """
 import json
-from datetime import datetime
+from collections import Counter
 from typing import Dict, List, Optional
 
-from src.models import AnalysisResponse, Error, ResponseStatus, Metadata, ResourceCounts
+from src.models import AnalysisResponse, ConfidenceLevel, Error, ResponseStatus, Metadata, ResourceCounts
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 class ResponseFormatter:
@@ -24,16 +29,18 @@ class ResponseFormatter:
         self.errors = errors
         self.resource_counts = resource_counts
     
-    def format_response(self) -> str:
+    def format_response(self, pretty: bool = True) -> str:
         """
         Format the final JSON response.
         
+        Args:
+            pretty: Indent the JSON output when True, emit compact JSON otherwise
+            
         Returns:
             JSON string with the formatted response
         """
-        # Generate metadata
-        metadata = Metadata(
-            timestamp=datetime.now(),
+        # Generate metadata; fields are produced internally, so skip validation
+        metadata = Metadata.model_construct(
             resourceCount=self.resource_counts
         )
         
@@ -44,15 +51,19 @@ class ResponseFormatter:
         summary = self._generate_summary(status)
         
         # Create the response object
-        response = AnalysisResponse(
+        response = AnalysisResponse.model_construct(
             status=status,
             summary=summary,
             errors=self.errors,
             metadata=metadata
         )
         
-        # Convert to JSON
-        return response.model_dump_json(indent=2, exclude_none=True)
+        # Convert to JSON, using orjson when it is installed
+        if orjson is not None:
+            payload = response.model_dump(exclude_none=True)
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(payload, option=option).decode('utf-8')
+        return response.model_dump_json(indent=2 if pretty else None, exclude_none=True)
     
     def _determine_status(self) -> ResponseStatus:
         """
@@ -66,8 +77,9 @@ class ResponseFormatter:
         
         # If we have errors but no recommendations with high confidence
         high_confidence_recs = any(
-            any(rec.confidence == "high" for rec in error.recommendations)
+            rec.confidence is ConfidenceLevel.HIGH
             for error in self.errors
+            for rec in error.recommendations
         )
         
         if not high_confidence_recs:
@@ -93,15 +105,9 @@ class ResponseFormatter:
         if status == ResponseStatus.UNKNOWN:
             return f"Found {error_count} issue{'s' if error_count != 1 else ''} in your Terraform plan, but couldn't determine specific solutions. Check the error details for more information."
         
-        # Group errors by type
-        error_types = {}
-        for error in self.errors:
-            if error.errorType not in error_types:
-                error_types[error.errorType] = 0
-            error_types[error.errorType] += 1
-        
-        # Find the most common error type
-        most_common_type = max(error_types.items(), key=lambda x: x[1])[0] if error_types else None
+        # Count errors by type and find the most common one
+        error_types = Counter(error.errorType for error in self.errors)
+        most_common_type = error_types.most_common(1)[0][0] if error_types else None
         
         if most_common_type:
             return f"Found {error_count} issue{'s' if error_count != 1 else ''} in your Terraform plan. Most are related to {most_common_type} problems. Check the recommendations for solutions."
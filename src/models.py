@@ -2,9 +2,9 @@
 Data models for the Terraform Plan Analyzer.
 """
 from enum import Enum
-from typing import List, Dict, Optional
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import List, Dict, NamedTuple, Optional
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ErrorType(str, Enum):
@@ -34,8 +34,19 @@ class ResponseStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+class ErrorContext(NamedTuple):
+    """An error block extracted from the plan, with its location details."""
+    message: str
+    resource_path: Optional[str]
+    line_number: Optional[str]
+    resource_type: Optional[str]
+    resource_name: Optional[str]
+
+
 class AffectedResource(BaseModel):
     """Model representing a resource affected by an error."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Resource name")
     type: str = Field(..., description="Resource type (e.g., aws_instance)")
     address: str = Field(..., description="Full resource address in Terraform")
@@ -43,6 +54,8 @@ class AffectedResource(BaseModel):
 
 class Recommendation(BaseModel):
     """Model representing a solution recommendation."""
+    model_config = ConfigDict(frozen=True)
+    
     description: str = Field(..., description="Friendly explanation of solution")
     code: Optional[str] = Field(None, description="Example code or command to fix the issue")
     confidence: ConfidenceLevel = Field(..., description="Confidence level in the recommendation")
@@ -68,7 +81,8 @@ class ResourceCounts(BaseModel):
 class Metadata(BaseModel):
     """Model representing metadata about the analysis."""
     planId: Optional[str] = Field(None, description="Optional plan identifier")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp of analysis")
+    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat(),
+                           description="ISO 8601 timestamp of analysis (UTC)")
     resourceCount: Optional[ResourceCounts] = Field(None, 
                                                   description="Count of resources by operation")
 
@@ -78,4 +92,4 @@ class AnalysisResponse(BaseModel):
     status: ResponseStatus = Field(..., description="Overall status of the analysis")
     summary: str = Field(..., description="Friendly overview of plan results")
     errors: List[Error] = Field(default_factory=list, description="List of errors found in the plan")
-    metadata: Metadata = Field(default_factory=Metadata, description="Metadata about the analysis")
\ No newline at end of file
+    metadata: Metadata = Field(default_factory=lambda: Metadata(), description="Metadata about the analysis")
\ No newline at end of file
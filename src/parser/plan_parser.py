@@ -2,9 +2,21 @@
 Parser module for Terraform plan output.
 """
 import re
-from typing import Dict, List, Optional, Tuple
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.models import ResourceCounts
+from src.models import ErrorContext, ResourceCounts
+
+
+_VERSION_RE = re.compile(r'Terraform\s+v(\d+\.\d+\.\d+)')
+# Starts an error block, whether plain or box-drawn (╷ │)
+_ERROR_MARKER = 'Error: '
+_ADD_RE = re.compile(r'(\d+) to add')
+_CHANGE_RE = re.compile(r'(\d+) to change')
+_DESTROY_RE = re.compile(r'(\d+) to destroy')
+_LOCATION_RE = re.compile(r'on\s+([^:]+):(\d+)')
+_RESOURCE_ADDR_RE = re.compile(r'resource "([^"]+)" "([^"]+)"')
+_ALT_ADDR_RE = re.compile(r'([a-zA-Z0-9_\-.]+\.[a-zA-Z0-9_\-.]+)(?:\[\d+\])?')
 
 
 class TerraformPlanParser:
@@ -22,7 +34,7 @@ class TerraformPlanParser:
         self.plan_output = plan_output
         self.plan_sections = self._split_into_sections()
         
-    def _split_into_sections(self) -> Dict[str, str]:
+    def _split_into_sections(self) -> Dict[str, Any]:
         """
         Split the plan output into meaningful sections.
         
@@ -35,37 +47,56 @@ class TerraformPlanParser:
             'initialization': '',
             'plan': '',
             'changes': '',
-            'errors': ''
+            'errors_list': []
         }
         
-        # Extract terraform version
-        version_match = re.search(r'Terraform\s+v(\d+\.\d+\.\d+)', self.plan_output)
-        if version_match:
-            sections['terraform_version'] = version_match.group(1)
-        
-        # Extract plan summary and changes
-        plan_section = re.search(
-            r'(Plan:.*?)(?=\n\n|\Z)', 
-            self.plan_output, 
-            re.DOTALL
-        )
-        if plan_section:
-            sections['plan'] = plan_section.group(1).strip()
-        
-        # Extract error messages
-        error_patterns = [
-            r'Error: (.*?)(?=\n\n|\Z)',
-            r'│ Error: (.*?)(?=\n\n|\Z)',
-            r'╷\s*│\s*Error: (.*?)(?=\n\n|\Z)'
-        ]
-        
+        version = None
+        plan_lines = None
+        plan_done = False
+        error_lines = None
         all_errors = []
-        for pattern in error_patterns:
-            errors = re.findall(pattern, self.plan_output, re.DOTALL)
-            all_errors.extend(errors)
         
-        if all_errors:
-            sections['errors'] = '\n\n'.join([e.strip() for e in all_errors])
+        # Walk the output once; error blocks and the plan summary both run
+        # from their marker line up to the next blank line
+        for line in self.plan_output.splitlines():
+            if version is None:
+                version_match = _VERSION_RE.search(line)
+                if version_match:
+                    version = version_match.group(1)
+            
+            if plan_lines is not None:
+                if line:
+                    plan_lines.append(line)
+                else:
+                    plan_done = True
+                    sections['plan'] = '\n'.join(plan_lines).strip()
+                    plan_lines = None
+            elif not plan_done:
+                plan_start = line.find('Plan:')
+                if plan_start != -1:
+                    plan_lines = [line[plan_start:]]
+            
+            if error_lines is not None:
+                if line:
+                    error_lines.append(line)
+                else:
+                    all_errors.append('\n'.join(error_lines))
+                    error_lines = None
+            else:
+                error_start = line.find(_ERROR_MARKER)
+                if error_start != -1:
+                    error_lines = [line[error_start + len(_ERROR_MARKER):]]
+        
+        # Close sections still open at the end of the output
+        if plan_lines is not None:
+            sections['plan'] = '\n'.join(plan_lines).strip()
+        if error_lines is not None:
+            all_errors.append('\n'.join(error_lines))
+        
+        if version:
+            sections['terraform_version'] = version
+        
+        sections['errors_list'] = [e.strip() for e in all_errors if e.strip()]
         
         return sections
     
@@ -73,18 +104,25 @@ class TerraformPlanParser:
         """
         Extract resource count information from the plan.
         
+        The counts are computed on first use and cached on the parser.
+        
         Returns:
             ResourceCounts object containing the number of resources to add, change, destroy
         """
+        return self._resource_counts
+    
+    @cached_property
+    def _resource_counts(self) -> Optional[ResourceCounts]:
+        """Resource counts parsed from the plan summary."""
         if not self.plan_sections.get('plan'):
             return None
         
         plan_text = self.plan_sections['plan']
         
         # Extract resource counts using regex
-        add_match = re.search(r'(\d+) to add', plan_text)
-        change_match = re.search(r'(\d+) to change', plan_text)
-        destroy_match = re.search(r'(\d+) to destroy', plan_text)
+        add_match = _ADD_RE.search(plan_text)
+        change_match = _CHANGE_RE.search(plan_text)
+        destroy_match = _DESTROY_RE.search(plan_text)
         
         add_count = int(add_match.group(1)) if add_match else 0
         change_count = int(change_match.group(1)) if change_match else 0
@@ -103,52 +141,54 @@ class TerraformPlanParser:
         Returns:
             True if errors were detected, False otherwise
         """
-        return bool(self.plan_sections.get('errors'))
+        return bool(self.plan_sections['errors_list'])
     
-    def extract_error_contexts(self) -> List[Dict[str, str]]:
+    def extract_error_contexts(self) -> List[ErrorContext]:
         """
         Extract errors with their surrounding context.
         
+        The contexts are computed on first use and cached on the parser.
+        
         Returns:
-            List of dictionaries with error information and context
+            List of ErrorContext tuples with error information and context
         """
+        return self._error_contexts
+    
+    @cached_property
+    def _error_contexts(self) -> List[ErrorContext]:
+        """Error contexts parsed from the error blocks."""
         if not self.has_errors():
             return []
         
         error_contexts = []
-        error_blocks = re.split(r'\n\s*\n', self.plan_sections['errors'])
         
-        for block in error_blocks:
-            # Skip empty blocks
-            if not block.strip():
-                continue
-                
+        for block in self.plan_sections['errors_list']:
             # Extract the error message and any resource information
-            error_message = block.strip()
-            resource_match = re.search(r'on\s+([^:]+):(\d+)', block)
+            error_message = block
+            resource_match = _LOCATION_RE.search(block)
             resource_path = resource_match.group(1) if resource_match else None
             line_number = resource_match.group(2) if resource_match else None
             
             # Extract any resource address
-            address_match = re.search(r'resource "([^"]+)" "([^"]+)"', block)
+            address_match = _RESOURCE_ADDR_RE.search(block)
             resource_type = address_match.group(1) if address_match else None
             resource_name = address_match.group(2) if address_match else None
             
             # Extract resource address from other formats
             if not resource_type or not resource_name:
-                alt_address = re.search(r'([a-zA-Z0-9_\-.]+\.[a-zA-Z0-9_\-.]+)(?:\[\d+\])?', block)
+                alt_address = _ALT_ADDR_RE.search(block)
                 if alt_address:
                     parts = alt_address.group(1).split('.')
                     if len(parts) >= 2:
                         resource_type = parts[-2]
                         resource_name = parts[-1]
             
-            error_contexts.append({
-                'message': error_message,
-                'resource_path': resource_path,
-                'line_number': line_number,
-                'resource_type': resource_type,
-                'resource_name': resource_name
-            })
+            error_contexts.append(ErrorContext(
+                message=error_message,
+                resource_path=resource_path,
+                line_number=line_number,
+                resource_type=resource_type,
+                resource_name=resource_name
+            ))
         
         return error_contexts
\ No newline at end of file
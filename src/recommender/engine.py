@@ -2,24 +2,355 @@
 Recommendation engine for Terraform plan errors.
 """
 import re
-from typing import Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from src.models import Error, ErrorType, Recommendation, ConfidenceLevel, AffectedResource
 
 
+# Confidence levels bound once for the many recommendations built below
+HIGH, MEDIUM, LOW = ConfidenceLevel.HIGH, ConfidenceLevel.MEDIUM, ConfidenceLevel.LOW
+
+
+# Plans with at least this many errors generate recommendations in a thread
+# pool; below it the pool's startup cost outweighs the work per error
+_PARALLEL_THRESHOLD = 64
+
+# Handlers hold the GIL throughout (re does not release it), so the pool is
+# only used on free-threaded interpreters where threads truly run in parallel
+_THREADS_RUN_IN_PARALLEL = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+# Literals every match of a handler's regex probes contains; when none is
+# present the probes cannot match and are skipped
+_PROBE_TRIGGERS: Dict[ErrorType, Tuple[str, ...]] = {
+    ErrorType.VALIDATION: ("value for '", "expected "),
+    ErrorType.DEPENDENCY: ("unknown resource '",),
+}
+
+
+class _Patterns:
+    """
+    Compiled regex probes used by the handlers.
+    
+    Probes that need captures are combined so the message is scanned once.
+    Captures sit inside lookaheads, so each match consumes only its fixed
+    prefix and probes overlapping a capture are still found. Probes for
+    plain keywords are substring checks on the lowercased message instead,
+    so they ignore case.
+    """
+    
+    def __init__(self) -> None:
+        """Compile the probe patterns."""
+        self.validation: re.Pattern[str] = re.compile(
+            r"(?P<field>value for (?='(?P<field_name>[^']+)'))"
+            r"|(?P<expected>expected (?=(?P<expected_value>.+)))"
+        )
+        self.unknown: re.Pattern[str] = re.compile(r"unknown resource '([^']+)'")
+
+
+@lru_cache(maxsize=None)
+def _patterns() -> _Patterns:
+    """
+    Compile the regex probes on first use.
+    
+    Plans without errors never reach a handler, so they skip the compile.
+    
+    Returns:
+        The compiled probe patterns
+    """
+    return _Patterns()
+
+
+def _has_trigger(error_type: ErrorType, message: str) -> bool:
+    """
+    Check whether a message could match the regex probes of an error type.
+    
+    Args:
+        error_type: Error type whose probe triggers to check
+        message: Error message to check
+        
+    Returns:
+        True if the message contains one of the trigger literals
+    """
+    return any(trigger in message for trigger in _PROBE_TRIGGERS[error_type])
+
+
+def _probe(pattern: re.Pattern[str], message: str) -> Dict[str, re.Match[str]]:
+    """
+    Scan a message once with a combined probe pattern.
+    
+    Args:
+        pattern: Alternation of named probe groups
+        message: Error message to scan
+        
+    Returns:
+        Dictionary mapping each probe name found to its first match
+    """
+    found: Dict[str, re.Match[str]] = {}
+    for match in pattern.finditer(message):
+        name: Optional[str] = match.lastgroup
+        if name is not None:
+            found.setdefault(name, match)
+    return found
+
+
+# Example code attached to recommendations; templates are filled with str.format
+_REQUIRED_FIELD_TEMPLATE = "resource \"{resource_type}\" \"name\" \n  # Add this required field\n  {field} = \"value\"\n  # ... other configuration ...\n"
+_LOCALS_CODE = "locals {\n  intermediate_value = \"something\"\n}\n\nresource \"type\" \"name\" {\n  property = local.intermediate_value\n}"
+_DEPENDS_ON_CODE = "resource \"type\" \"name\" {\n  # ...\n  depends_on = [\n    resource.dependency\n  ]\n}"
+_AWS_IAM_POLICY_CODE = "{\n  \"Version\": \"2012-10-17\",\n  \"Statement\": [\n    {\n      \"Effect\": \"Allow\",\n      \"Action\": [\n        \"service:Action\"\n      ],\n      \"Resource\": \"*\"\n    }\n  ]\n}"
+_AZURE_ROLE_CODE = "az role assignment create --assignee \"$CLIENT_ID\" --role \"Contributor\" --scope \"/subscriptions/$SUBSCRIPTION_ID\""
+_STATE_RM_TEMPLATE = "terraform state rm {resource_type}.{resource_name}"
+_IMPORT_TEMPLATE = "terraform import {resource_type}.{resource_name} <resource_id>"
+_REQUIRED_PROVIDERS_CODE = 'terraform {\n  required_providers {\n    aws = {\n      source  = "hashicorp/aws"\n      version = "~> 4.0"\n    }\n  }\n}'
+_MODULE_SOURCE_CODE = 'module "example" {\n  source = "hashicorp/consul/aws"\n  version = "0.1.0"\n}'
+_MODULE_VERSION_CODE = 'module "example" {\n  source  = "hashicorp/consul/aws"\n  version = "~> 0.1.0"\n}'
+
+# Recommendations that never vary; Recommendation is frozen, so one
+# instance is shared by every error that needs it
+_REC_BREAK_CYCLE = Recommendation(
+    description="Break the circular dependency between resources by restructuring your configuration",
+    confidence=MEDIUM
+)
+_REC_LOCALS_FOR_CYCLE = Recommendation(
+    description="Consider using a local value or variable to break the dependency cycle",
+    code=_LOCALS_CODE,
+    confidence=MEDIUM
+)
+_REC_CHECK_REFERENCES = Recommendation(
+    description="Check that all referenced resources exist and are correctly spelled",
+    confidence=MEDIUM
+)
+_REC_DEPENDS_ON = Recommendation(
+    description="Make sure your resource dependencies are correctly defined using depends_on if needed",
+    code=_DEPENDS_ON_CODE,
+    confidence=MEDIUM
+)
+_REC_CREDENTIALS_CHECK = Recommendation(
+    description="Check that your credentials have sufficient permissions for this operation",
+    confidence=HIGH
+)
+_REC_AWS_IAM_POLICY = Recommendation(
+    description="Ensure your AWS IAM user or role has the necessary permissions to manage these resources",
+    code=_AWS_IAM_POLICY_CODE,
+    confidence=MEDIUM
+)
+_REC_AZURE_ROLE = Recommendation(
+    description="Check that your Azure service principal has the required role assignments",
+    code=_AZURE_ROLE_CODE,
+    confidence=MEDIUM
+)
+_REC_CREDENTIALS_EXPIRY = Recommendation(
+    description="Verify that your authentication credentials are correct and not expired",
+    confidence=MEDIUM
+)
+_REC_UNBALANCED_QUOTES = Recommendation(
+    description="Check for missing or unbalanced quotes in your configuration",
+    confidence=HIGH
+)
+_REC_UNBALANCED_BRACKETS = Recommendation(
+    description="Fix unbalanced brackets or braces in your configuration",
+    confidence=HIGH
+)
+_REC_TF_FMT = Recommendation(
+    description="Run 'terraform fmt' to automatically fix minor syntax issues",
+    code="terraform fmt",
+    confidence=HIGH
+)
+_REC_HCL_DOCS = Recommendation(
+    description="Check the HCL syntax documentation for proper formatting",
+    confidence=MEDIUM
+)
+_REC_REMOVE_DEPENDENCY = Recommendation(
+    description="Identify and remove the dependency on this resource before making changes",
+    confidence=MEDIUM
+)
+_REC_TF_REFRESH = Recommendation(
+    description="Refresh the Terraform state to match the current real infrastructure",
+    code="terraform refresh",
+    confidence=HIGH
+)
+_REC_MATCH_MANUAL_CHANGES = Recommendation(
+    description="If the resource has been manually modified, update your configuration to match the current state",
+    confidence=MEDIUM
+)
+_REC_PROVIDER_VERSION = Recommendation(
+    description="Update your provider version constraint in the required_providers block",
+    code=_REQUIRED_PROVIDERS_CODE,
+    confidence=HIGH
+)
+_REC_REINSTALL_PROVIDER = Recommendation(
+    description="Reinstall the provider plugin by running terraform init",
+    code="terraform init -upgrade",
+    confidence=HIGH
+)
+_REC_PROVIDER_CONFIG = Recommendation(
+    description="Check your provider configuration for any missing required attributes",
+    confidence=MEDIUM
+)
+_REC_MODULE_SOURCE = Recommendation(
+    description="Check that the module source URL is correct and accessible",
+    code=_MODULE_SOURCE_CODE,
+    confidence=HIGH
+)
+_REC_MODULE_VERSION = Recommendation(
+    description="Update the module version to a compatible version",
+    code=_MODULE_VERSION_CODE,
+    confidence=HIGH
+)
+_REC_TF_INIT = Recommendation(
+    description="Run terraform init to download any missing modules",
+    code="terraform init",
+    confidence=MEDIUM
+)
+_REC_TF_DOCS = Recommendation(
+    description="Check the Terraform documentation for this specific error message",
+    confidence=MEDIUM
+)
+_REC_TF_VALIDATE = Recommendation(
+    description="Try running 'terraform validate' for more detailed error information",
+    code="terraform validate",
+    confidence=MEDIUM
+)
+_REC_TF_VERSION = Recommendation(
+    description="Make sure you're using a compatible Terraform version for your configuration",
+    confidence=LOW
+)
+
+# Fixed fallback for unclassified errors
+_OTHER_RECOMMENDATIONS: List[Recommendation] = [_REC_TF_DOCS, _REC_TF_VALIDATE, _REC_TF_VERSION]
+
+# Advice given after any branch-specific recommendation, whichever matched
+_SYNTAX_TAIL: Tuple[Recommendation, ...] = (_REC_TF_FMT, _REC_HCL_DOCS)
+_PROVIDER_TAIL: Tuple[Recommendation, ...] = (_REC_PROVIDER_CONFIG,)
+_MODULE_TAIL: Tuple[Recommendation, ...] = (_REC_TF_INIT,)
+
+
+class _Rule(NamedTuple):
+    """Recommendations to give when the message contains any of the keywords."""
+    keywords: Tuple[str, ...]
+    recommendations: Tuple[Recommendation, ...]
+
+
+# Literal alternatives probed with any(); these are checked against the
+# lowercased message, so they are lowercase too
+_AWS_KEYS = ('aws', 'iam')
+_AZURE_KEYS = ('azure', 'microsoft')
+_QUOTE_KEYS = ('expected quote', 'missing quote', 'expected "', 'missing "')
+_BRACKET_KEYS = (
+    'expected bracket', 'missing bracket',
+    'expected {', 'missing {', 'expected }', 'missing }',
+    'expected (', 'missing (', 'expected )', 'missing )',
+)
+_PLUGIN_KEYS = ('plugin', 'binary')
+
+# Keyword-driven branches for handlers that only pick fixed recommendations.
+# Rules are tried in order and the first match wins, like an if/elif chain.
+_BRANCH_RULES: Dict[ErrorType, Tuple[_Rule, ...]] = {
+    ErrorType.PERMISSION: (
+        _Rule(_AWS_KEYS, (_REC_AWS_IAM_POLICY,)),
+        _Rule(_AZURE_KEYS, (_REC_AZURE_ROLE,)),
+    ),
+    ErrorType.SYNTAX: (
+        _Rule(_QUOTE_KEYS, (_REC_UNBALANCED_QUOTES,)),
+        _Rule(_BRACKET_KEYS, (_REC_UNBALANCED_BRACKETS,)),
+    ),
+    ErrorType.PROVIDER: (
+        _Rule(('version',), (_REC_PROVIDER_VERSION,)),
+        _Rule(_PLUGIN_KEYS, (_REC_REINSTALL_PROVIDER,)),
+    ),
+    ErrorType.MODULE: (
+        _Rule(('source',), (_REC_MODULE_SOURCE,)),
+        _Rule(('version',), (_REC_MODULE_VERSION,)),
+    ),
+}
+
+
+def _match_branch(error_type: ErrorType, message: str) -> Tuple[Recommendation, ...]:
+    """
+    Pick the recommendations of the first branch rule matching a message.
+    
+    Args:
+        error_type: Error type whose rules to apply
+        message: Error message to check
+        
+    Returns:
+        Tuple of recommendations, empty if no rule matches
+    """
+    lowered: str = message.lower()
+    for rule in _BRANCH_RULES[error_type]:
+        if any(keyword in lowered for keyword in rule.keywords):
+            return rule.recommendations
+    return ()
+
+
+def _resource_ref(error: Error) -> Tuple[str, str]:
+    """
+    Get the type and name of the first resource affected by an error.
+    
+    Args:
+        error: Error to inspect
+        
+    Returns:
+        Tuple of (resource_type, resource_name), with placeholders if the
+        error has no affected resource
+    """
+    if error.affectedResources:
+        affected: AffectedResource = error.affectedResources[0]
+        return affected.type, affected.name
+    return "resource", "name"
+
+
+def _import_recommendation(resource_type: str, resource_name: str,
+                           description: str, confidence: ConfidenceLevel) -> Recommendation:
+    """
+    Build a recommendation to import a resource into Terraform state.
+    
+    Args:
+        resource_type: Type of the resource to import
+        resource_name: Name of the resource to import
+        description: Description of the recommendation
+        confidence: Confidence level of the recommendation
+        
+    Returns:
+        Recommendation with the terraform import command for the resource
+    """
+    return Recommendation(
+        description=description,
+        code=_IMPORT_TEMPLATE.format(resource_type=resource_type, resource_name=resource_name),
+        confidence=confidence
+    )
+
+
+# Signature shared by every per-type recommendation handler
+Handler = Callable[[Error], List[Recommendation]]
+
+
 class RecommendationEngine:
     """
     Generates recommendations for fixing errors in Terraform plans.
     """
     
-    def __init__(self, errors: List[Error]):
+    def __init__(self, errors: List[Error]) -> None:
         """
         Initialize the recommendation engine with detected errors.
         
         Args:
             errors: List of Error objects from the error detector
         """
-        self.errors = errors
+        self.errors: List[Error] = errors
+        self._dispatch: Dict[ErrorType, Handler] = {
+            ErrorType.VALIDATION: self._recommendations_for_validation,
+            ErrorType.DEPENDENCY: self._recommendations_for_dependency,
+            ErrorType.PERMISSION: self._recommendations_for_permission,
+            ErrorType.SYNTAX: self._recommendations_for_syntax,
+            ErrorType.RESOURCE_CONFLICT: self._recommendations_for_conflict,
+            ErrorType.STATE_MISMATCH: self._recommendations_for_state_mismatch,
+            ErrorType.PROVIDER: self._recommendations_for_provider,
+            ErrorType.MODULE: self._recommendations_for_module,
+        }
     
     def generate_recommendations(self) -> List[Error]:
         """
@@ -28,11 +359,22 @@ class RecommendationEngine:
         Returns:
             Updated list of Error objects with recommendations added
         """
-        for error in self.errors:
-            recommendations = self._generate_recommendations_for_error(error)
-            error.recommendations = recommendations
+        # Bind the lookups once; they are used for every error in the plan
+        generate: Handler = self._generate_recommendations_for_error
+        errors: List[Error] = self.errors
+        if _THREADS_RUN_IN_PARALLEL and len(errors) >= _PARALLEL_THRESHOLD:
+            # Imported here so GIL builds, which never take this path, skip it
+            from concurrent.futures import ThreadPoolExecutor
             
-        return self.errors
+            # Recommendations for one error never depend on another
+            with ThreadPoolExecutor() as executor:
+                for error, recommendations in zip(errors, executor.map(generate, errors)):
+                    error.recommendations = recommendations
+        else:
+            for error in errors:
+                error.recommendations = generate(error)
+            
+        return errors
     
     def _generate_recommendations_for_error(self, error: Error) -> List[Recommendation]:
         """
@@ -44,373 +386,151 @@ class RecommendationEngine:
         Returns:
             List of Recommendation objects
         """
-        if error.errorType == ErrorType.VALIDATION:
-            return self._recommendations_for_validation(error)
-        elif error.errorType == ErrorType.DEPENDENCY:
-            return self._recommendations_for_dependency(error)
-        elif error.errorType == ErrorType.PERMISSION:
-            return self._recommendations_for_permission(error)
-        elif error.errorType == ErrorType.SYNTAX:
-            return self._recommendations_for_syntax(error)
-        elif error.errorType == ErrorType.RESOURCE_CONFLICT:
-            return self._recommendations_for_conflict(error)
-        elif error.errorType == ErrorType.STATE_MISMATCH:
-            return self._recommendations_for_state_mismatch(error)
-        elif error.errorType == ErrorType.PROVIDER:
-            return self._recommendations_for_provider(error)
-        elif error.errorType == ErrorType.MODULE:
-            return self._recommendations_for_module(error)
-        else:
-            return self._recommendations_for_other(error)
+        # Nothing to probe in an empty message, so only general advice applies
+        if not error.message:
+            return list(_OTHER_RECOMMENDATIONS)
+        
+        handler: Handler = self._dispatch.get(error.errorType, self._recommendations_for_other)
+        return handler(error)
     
     def _recommendations_for_validation(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for validation errors."""
-        recommendations = []
-        
         # Extract field and expected value patterns
-        field_match = re.search(r'value for \'([^\']+)\'', error.message)
-        expected_match = re.search(r'expected (.+)', error.message)
-        required_match = re.search(r'required field', error.message)
+        probes: Dict[str, re.Match[str]] = (
+            _probe(_patterns().validation, error.message)
+            if _has_trigger(ErrorType.VALIDATION, error.message) else {}
+        )
+        field_match: Optional[re.Match[str]] = probes.get('field')
+        expected_match: Optional[re.Match[str]] = probes.get('expected')
+        required_match: bool = 'required field' in error.message.lower()
         
-        field = field_match.group(1) if field_match else "the field"
+        field: str = field_match.group('field_name') if field_match else "the field"
         
         if expected_match:
-            expected_value = expected_match.group(1)
-            recommendations.append(
+            expected_value: str = expected_match.group('expected_value')
+            return [
                 Recommendation(
                     description=f"Update {field} to match the expected format: {expected_value}",
-                    confidence=ConfidenceLevel.HIGH
+                    confidence=HIGH
                 )
-            )
+            ]
         
-        elif required_match:
-            resource_type = error.affectedResources[0].type if error.affectedResources else "resource"
-            recommendations.append(
+        if required_match:
+            resource_type, _ = _resource_ref(error)
+            return [
                 Recommendation(
                     description=f"Add the required '{field}' field to your {resource_type} configuration",
-                    code=f"resource \"{resource_type}\" \"name\" \n  # Add this required field\n  {field} = \"value\"\n  # ... other configuration ...\n",
-                    confidence=ConfidenceLevel.HIGH
+                    code=_REQUIRED_FIELD_TEMPLATE.format(resource_type=resource_type, field=field),
+                    confidence=HIGH
                 )
-            )
+            ]
         
-        else:
-            recommendations.append(
-                Recommendation(
-                    description=f"Check the documentation for valid values of '{field}' and update your configuration accordingly",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
+        return [
+            Recommendation(
+                description=f"Check the documentation for valid values of '{field}' and update your configuration accordingly",
+                confidence=MEDIUM
             )
-            
-        return recommendations
+        ]
     
     def _recommendations_for_dependency(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for dependency errors."""
-        recommendations = []
-        
         # Check for unknown resource references
-        unknown_match = re.search(r'unknown resource \'([^\']+)\'', error.message)
-        cycle_match = re.search(r'cyclic dependency', error.message)
+        unknown_match: Optional[re.Match[str]] = (
+            _patterns().unknown.search(error.message)
+            if _has_trigger(ErrorType.DEPENDENCY, error.message) else None
+        )
+        cycle_match: bool = 'cyclic dependency' in error.message.lower()
         
         if unknown_match:
-            resource_ref = unknown_match.group(1)
-            recommendations.append(
+            resource_ref: str = unknown_match.group(1)
+            return [
                 Recommendation(
                     description=f"Define the missing resource '{resource_ref}' or correct the reference if it's misspelled",
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-            recommendations.append(
+                    confidence=HIGH
+                ),
                 Recommendation(
                     description=f"Ensure that the resource '{resource_ref}' is in the correct module scope",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
+                    confidence=MEDIUM
+                ),
+            ]
             
-        elif cycle_match:
-            recommendations.append(
-                Recommendation(
-                    description="Break the circular dependency between resources by restructuring your configuration",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
-            
-            recommendations.append(
-                Recommendation(
-                    description="Consider using a local value or variable to break the dependency cycle",
-                    code="locals {\n  intermediate_value = \"something\"\n}\n\nresource \"type\" \"name\" {\n  property = local.intermediate_value\n}",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
+        if cycle_match:
+            return [_REC_BREAK_CYCLE, _REC_LOCALS_FOR_CYCLE]
         
-        else:
-            recommendations.append(
-                Recommendation(
-                    description="Check that all referenced resources exist and are correctly spelled",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
-            
-            recommendations.append(
-                Recommendation(
-                    description="Make sure your resource dependencies are correctly defined using depends_on if needed",
-                    code="resource \"type\" \"name\" {\n  # ...\n  depends_on = [\n    resource.dependency\n  ]\n}",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
-            
-        return recommendations
+        return [_REC_CHECK_REFERENCES, _REC_DEPENDS_ON]
     
     def _recommendations_for_permission(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for permission errors."""
-        recommendations = []
-        
-        # Common provider patterns
-        aws_match = re.search(r'(AWS|IAM|arn:aws)', error.message)
-        azure_match = re.search(r'(Azure|Microsoft)', error.message)
-        
-        # General permission recommendation
-        recommendations.append(
-            Recommendation(
-                description="Check that your credentials have sufficient permissions for this operation",
-                confidence=ConfidenceLevel.HIGH
-            )
-        )
-        
-        if aws_match:
-            recommendations.append(
-                Recommendation(
-                    description="Ensure your AWS IAM user or role has the necessary permissions to manage these resources",
-                    code="{\n  \"Version\": \"2012-10-17\",\n  \"Statement\": [\n    {\n      \"Effect\": \"Allow\",\n      \"Action\": [\n        \"service:Action\"\n      ],\n      \"Resource\": \"*\"\n    }\n  ]\n}",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
-            
-        elif azure_match:
-            recommendations.append(
-                Recommendation(
-                    description="Check that your Azure service principal has the required role assignments",
-                    code="az role assignment create --assignee \"$CLIENT_ID\" --role \"Contributor\" --scope \"/subscriptions/$SUBSCRIPTION_ID\"",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
-            
-        recommendations.append(
-            Recommendation(
-                description="Verify that your authentication credentials are correct and not expired",
-                confidence=ConfidenceLevel.MEDIUM
-            )
-        )
-        
-        return recommendations
+        # General permission recommendation, then any cloud-specific advice
+        return [
+            _REC_CREDENTIALS_CHECK,
+            *_match_branch(ErrorType.PERMISSION, error.message),
+            _REC_CREDENTIALS_EXPIRY,
+        ]
     
     def _recommendations_for_syntax(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for syntax errors."""
-        recommendations = []
-        
         # Common syntax issues
-        quotes_match = re.search(r'(expected|missing) (quote|")', error.message)
-        brackets_match = re.search(r'(expected|missing) (bracket|{|}|\(|\))', error.message)
-        
-        if quotes_match:
-            recommendations.append(
-                Recommendation(
-                    description="Check for missing or unbalanced quotes in your configuration",
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-        elif brackets_match:
-            recommendations.append(
-                Recommendation(
-                    description="Fix unbalanced brackets or braces in your configuration",
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-        recommendations.append(
-            Recommendation(
-                description="Run 'terraform fmt' to automatically fix minor syntax issues",
-                code="terraform fmt",
-                confidence=ConfidenceLevel.HIGH
-            )
-        )
-        
-        recommendations.append(
-            Recommendation(
-                description="Check the HCL syntax documentation for proper formatting",
-                confidence=ConfidenceLevel.MEDIUM
-            )
-        )
-        
-        return recommendations
+        return [*_match_branch(ErrorType.SYNTAX, error.message), *_SYNTAX_TAIL]
     
     def _recommendations_for_conflict(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for resource conflicts."""
-        recommendations = []
-        
-        # Extract resource information if available
-        resource_type = error.affectedResources[0].type if error.affectedResources else "resource"
-        resource_name = error.affectedResources[0].name if error.affectedResources else "name"
+        resource_type, resource_name = _resource_ref(error)
         
         # Check for common conflict patterns
-        exists_match = re.search(r'already exists', error.message)
-        in_use_match = re.search(r'in use', error.message)
+        message: str = error.message.lower()
+        exists_match: bool = 'already exists' in message
+        in_use_match: bool = 'in use' in message
+        
+        state_rm: Recommendation = Recommendation(
+            description="Check if you can use 'terraform state rm' to remove the conflicting resource from state if it no longer exists",
+            code=_STATE_RM_TEMPLATE.format(resource_type=resource_type, resource_name=resource_name),
+            confidence=LOW
+        )
         
         if exists_match:
-            recommendations.append(
-                Recommendation(
-                    description=f"Import the existing resource into your Terraform state instead of creating a new one",
-                    code=f"terraform import {resource_type}.{resource_name} <resource_id>",
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-            recommendations.append(
+            return [
+                _import_recommendation(
+                    resource_type, resource_name,
+                    "Import the existing resource into your Terraform state instead of creating a new one",
+                    HIGH
+                ),
                 Recommendation(
                     description=f"Use a different name for your {resource_type} to avoid the conflict",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
+                    confidence=MEDIUM
+                ),
+                state_rm,
+            ]
             
-        elif in_use_match:
-            recommendations.append(
-                Recommendation(
-                    description="Identify and remove the dependency on this resource before making changes",
-                    confidence=ConfidenceLevel.MEDIUM
-                )
-            )
+        if in_use_match:
+            return [_REC_REMOVE_DEPENDENCY, state_rm]
             
-        recommendations.append(
-            Recommendation(
-                description="Check if you can use 'terraform state rm' to remove the conflicting resource from state if it no longer exists",
-                code=f"terraform state rm {resource_type}.{resource_name}",
-                confidence=ConfidenceLevel.LOW
-            )
-        )
-        
-        return recommendations
+        return [state_rm]
     
     def _recommendations_for_state_mismatch(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for state mismatch errors."""
-        recommendations = []
-        
-        # Extract resource information if available
-        resource_type = error.affectedResources[0].type if error.affectedResources else "resource"
-        resource_name = error.affectedResources[0].name if error.affectedResources else "name"
-        
-        recommendations.append(
-            Recommendation(
-                description="Refresh the Terraform state to match the current real infrastructure",
-                code="terraform refresh",
-                confidence=ConfidenceLevel.HIGH
-            )
-        )
-        
-        recommendations.append(
-            Recommendation(
-                description=f"Import the existing resource into your Terraform state",
-                code=f"terraform import {resource_type}.{resource_name} <resource_id>",
-                confidence=ConfidenceLevel.MEDIUM
-            )
-        )
-        
-        recommendations.append(
-            Recommendation(
-                description="If the resource has been manually modified, update your configuration to match the current state",
-                confidence=ConfidenceLevel.MEDIUM
-            )
-        )
-        
-        return recommendations
+        resource_type, resource_name = _resource_ref(error)
+        
+        return [
+            _REC_TF_REFRESH,
+            _import_recommendation(
+                resource_type, resource_name,
+                "Import the existing resource into your Terraform state",
+                MEDIUM
+            ),
+            _REC_MATCH_MANUAL_CHANGES,
+        ]
     
     def _recommendations_for_provider(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for provider errors."""
-        recommendations = []
-        
         # Check for common provider issues
-        version_match = re.search(r'version', error.message)
-        plugin_match = re.search(r'plugin|binary', error.message)
-        
-        if version_match:
-            recommendations.append(
-                Recommendation(
-                    description="Update your provider version constraint in the required_providers block",
-                    code='terraform {\n  required_providers {\n    aws = {\n      source  = "hashicorp/aws"\n      version = "~> 4.0"\n    }\n  }\n}',
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-        elif plugin_match:
-            recommendations.append(
-                Recommendation(
-                    description="Reinstall the provider plugin by running terraform init",
-                    code="terraform init -upgrade",
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-        recommendations.append(
-            Recommendation(
-                description="Check your provider configuration for any missing required attributes",
-                confidence=ConfidenceLevel.MEDIUM
-            )
-        )
-        
-        return recommendations
+        return [*_match_branch(ErrorType.PROVIDER, error.message), *_PROVIDER_TAIL]
     
     def _recommendations_for_module(self, error: Error) -> List[Recommendation]:
         """Generate recommendations for module errors."""
-        recommendations = []
-        
         # Check for common module issues
-        source_match = re.search(r'source', error.message)
-        version_match = re.search(r'version', error.message)
-        
-        if source_match:
-            recommendations.append(
-                Recommendation(
-                    description="Check that the module source URL is correct and accessible",
-                    code='module "example" {\n  source = "hashicorp/consul/aws"\n  version = "0.1.0"\n}',
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-        elif version_match:
-            recommendations.append(
-                Recommendation(
-                    description="Update the module version to a compatible version",
-                    code='module "example" {\n  source  = "hashicorp/consul/aws"\n  version = "~> 0.1.0"\n}',
-                    confidence=ConfidenceLevel.HIGH
-                )
-            )
-            
-        recommendations.append(
-            Recommendation(
-                description="Run terraform init to download any missing modules",
-                code="terraform init",
-                confidence=ConfidenceLevel.MEDIUM
-            )
-        )
-        
-        return recommendations
+        return [*_match_branch(ErrorType.MODULE, error.message), *_MODULE_TAIL]
     
     def _recommendations_for_other(self, error: Error) -> List[Recommendation]:
         """Generate general recommendations for unclassified errors."""
-        recommendations = [
-            Recommendation(
-                description="Check the Terraform documentation for this specific error message",
-                confidence=ConfidenceLevel.MEDIUM
-            ),
-            Recommendation(
-                description="Try running 'terraform validate' for more detailed error information",
-                code="terraform validate",
-                confidence=ConfidenceLevel.MEDIUM
-            ),
-            Recommendation(
-                description="Make sure you're using a compatible Terraform version for your configuration",
-                confidence=ConfidenceLevel.LOW
-            )
-        ]
-        
-        return recommendations
\ No newline at end of file
+        return list(_OTHER_RECOMMENDATIONS)
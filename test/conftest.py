@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the Terraform Plan Analyzer tests.
+"""
+import pytest
+from pathlib import Path
+
+# Add the src directory to the Python path once for the whole test session
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session")
+def example_plan_with_errors():
+    """Contents of the example plan with errors, read once per session."""
+    example_file = Path(__file__).parent.parent / 'examples' / 'example_plan_with_errors.txt'
+    with open(example_file, 'r') as f:
+        return f.read()
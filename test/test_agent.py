@@ -4,21 +4,13 @@ Tests for the Terraform Plan Analyzer agent.
 import json
 import os
 import pytest
-from pathlib import Path
-
-# Add the src directory to the Python path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.agent import analyze_terraform_plan, parse_json_response
 
 
-def test_analyze_plan_with_errors():
+def test_analyze_plan_with_errors(example_plan_with_errors):
     """Test analyzing a plan with errors."""
-    # Load example plan with errors
-    example_file = Path(__file__).parent.parent / 'examples' / 'example_plan_with_errors.txt'
-    with open(example_file, 'r') as f:
-        plan_output = f.read()
+    plan_output = example_plan_with_errors
     
     # Analyze the plan
     result_json = analyze_terraform_plan(plan_output)
@@ -46,6 +38,16 @@ def test_analyze_plan_with_errors():
         assert len(error['recommendations']) > 0
 
 
+def test_analyze_plan_reports_each_error_once(example_plan_with_errors):
+    """Test that box-drawn error blocks are not collected more than once."""
+    plan_output = example_plan_with_errors
+    
+    result = parse_json_response(analyze_terraform_plan(plan_output))
+    
+    # The example plan contains three distinct error blocks
+    assert len(result['errors']) == 3
+
+
 def test_analyze_plan_no_errors():
     """Test analyzing a plan without errors."""
     # Create a minimal plan with no errors
@@ -71,5 +73,16 @@ Terraform has compared your real infrastructure against your configuration and f
     assert len(result['errors']) == 0
 
 
+def test_analyze_plan_compact_output(example_plan_with_errors):
+    """Test that pretty=False produces compact JSON with the same content."""
+    plan_output = example_plan_with_errors
+    
+    compact = parse_json_response(analyze_terraform_plan(plan_output, pretty=False))
+    pretty = parse_json_response(analyze_terraform_plan(plan_output))
+    
+    assert '\n' not in analyze_terraform_plan(plan_output, pretty=False)
+    assert compact['errors'] == pretty['errors']
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Tests for the command-line interface.
+"""
+import io
+import sys
+
+import pytest
+
+from src import cli
+
+
+def test_undecodable_file_is_reported(tmp_path, monkeypatch, capsys):
+    """Test that a plan file that is not valid UTF-8 exits with an error."""
+    plan_file = tmp_path / 'plan.txt'
+    plan_file.write_bytes(b'Error: \xff\xfe invalid\n')
+    monkeypatch.setattr(sys, 'argv', ['terraform-plan-analyzer', '--file', str(plan_file)])
+    
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+    
+    assert exc_info.value.code == 1
+    assert "Error reading file" in capsys.readouterr().err
+
+
+def test_undecodable_stdin_is_reported(monkeypatch, capsys):
+    """Test that stdin that is not valid UTF-8 exits with an error."""
+    monkeypatch.setattr(sys, 'argv', ['terraform-plan-analyzer'])
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(b'Error: \xff\xfe invalid\n')))
+    
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+    
+    assert exc_info.value.code == 1
+    assert "Error reading input" in capsys.readouterr().err
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
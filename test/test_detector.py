@@ -0,0 +1,131 @@
+"""
+Tests for the error classification in the ErrorDetector.
+"""
+import json
+import re
+import pytest
+
+from src.error_detector.detector import ErrorDetector, PATTERN_STATS_ENV, _build_hyperscan_database
+from src.models import ErrorContext, ErrorType
+
+
+MESSAGES = [
+    "Reference to undeclared resource\n\nA managed resource has not been declared in the root module.",
+    "Invalid resource type: The provider hashicorp/aws does not support it",
+    "Error creating Security Group: InvalidParameterValue: Invalid value 'x' for vpc",
+    "AccessDenied: Access Denied for provider aws",
+    "Failed to query available provider packages from registry.terraform.io",
+    "Expected a string\nbut got a number",
+    "expected string but got number",
+    "Unexpected \")\" in block",
+    "Cycle: cyclic dependency detected",
+    "Bucket ALREADY EXISTS",
+    "expected string but got number for module input",
+    "Unexpected \")\" in module block",
+    "Error in provider: expected ( after source",
+    "EXPECTED A LIST BUT GOT A MAP",
+    "Failed to install from REGISTRY.TERRAFORM.IO",
+    "Something went wrong",
+    "",
+]
+
+
+def _classify_sequentially(message):
+    """Reference implementation: first matching pattern in declaration order wins."""
+    for pattern, error_type in ErrorDetector.ERROR_PATTERNS:
+        if re.search(pattern, message, re.IGNORECASE):
+            return error_type
+    return ErrorType.OTHER
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_classification_matches_pattern_order(message):
+    """Test that the classifier keeps the first-match-wins semantics of ERROR_PATTERNS."""
+    detector = ErrorDetector([])
+    assert detector._classify_error_type(message) == _classify_sequentially(message)
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_hyperscan_classification_matches_pattern_order(message, monkeypatch):
+    """Test that the Hyperscan classifier keeps the first-match-wins semantics."""
+    pytest.importorskip("hyperscan")
+    monkeypatch.setattr(ErrorDetector, '_HS_DATABASE', _build_hyperscan_database(ErrorDetector.ERROR_PATTERNS))
+    detector = ErrorDetector([])
+    assert detector._classify_error_type(message) == _classify_sequentially(message)
+
+
+def test_unmatched_message_is_other():
+    """Test that messages matching no pattern are classified as OTHER."""
+    detector = ErrorDetector([])
+    assert detector._classify_error_type("Something went wrong") == ErrorType.OTHER
+
+
+def test_pattern_hits_are_recorded(tmp_path, monkeypatch):
+    """Test that pattern hit counts accumulate in the statistics file."""
+    stats_file = tmp_path / 'pattern_stats.json'
+    monkeypatch.setenv(PATTERN_STATS_ENV, str(stats_file))
+    contexts = [
+        ErrorContext("Bucket already exists", None, None, None, None),
+        ErrorContext("Something went wrong", None, None, None, None),
+    ]
+    
+    ErrorDetector(contexts).detect_errors()
+    ErrorDetector(contexts).detect_errors()
+    
+    assert json.loads(stats_file.read_text()) == {'already exists': 2}
+
+
+def test_pattern_hits_reuse_classification(tmp_path, monkeypatch):
+    """Test that recording statistics does not classify messages a second time."""
+    monkeypatch.setenv(PATTERN_STATS_ENV, str(tmp_path / 'pattern_stats.json'))
+    detector = ErrorDetector([ErrorContext("Bucket already exists", None, None, None, None)])
+    calls = []
+    match_pattern = detector._match_pattern
+    
+    def counting_match_pattern(message):
+        calls.append(message)
+        return match_pattern(message)
+    
+    monkeypatch.setattr(detector, '_match_pattern', counting_match_pattern)
+    
+    detector.detect_errors()
+    
+    assert calls == ["Bucket already exists"]
+
+
+def test_malformed_pattern_stats_are_replaced(tmp_path, monkeypatch):
+    """Test that a statistics file that is not a mapping is not merged."""
+    stats_file = tmp_path / 'pattern_stats.json'
+    stats_file.write_text(json.dumps(["already exists", "duplicate"]))
+    monkeypatch.setenv(PATTERN_STATS_ENV, str(stats_file))
+    
+    ErrorDetector([ErrorContext("Bucket already exists", None, None, None, None)]).detect_errors()
+    
+    assert json.loads(stats_file.read_text()) == {'already exists': 1}
+
+
+def test_unwritable_pattern_stats_do_not_break_detection(tmp_path, monkeypatch, capsys):
+    """Test that a statistics path that cannot be used only produces a warning."""
+    contexts = [ErrorContext("Bucket already exists", None, None, None, None)]
+    expected = ErrorDetector(contexts).detect_errors()
+    monkeypatch.setenv(PATTERN_STATS_ENV, str(tmp_path))
+    
+    errors = ErrorDetector(contexts).detect_errors()
+    
+    assert errors == expected
+    assert "could not write pattern statistics" in capsys.readouterr().err
+
+
+def test_undecodable_pattern_stats_are_replaced(tmp_path, monkeypatch):
+    """Test that a statistics file that is not valid text is treated as empty."""
+    stats_file = tmp_path / 'pattern_stats.json'
+    stats_file.write_bytes(b'\xff\xfe')
+    monkeypatch.setenv(PATTERN_STATS_ENV, str(stats_file))
+    
+    ErrorDetector([ErrorContext("Bucket already exists", None, None, None, None)]).detect_errors()
+    
+    assert json.loads(stats_file.read_text()) == {'already exists': 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,101 @@
+"""
+Tests for the RecommendationEngine.
+"""
+import pytest
+
+from src.models import AffectedResource, ConfidenceLevel, Error, ErrorType
+from src.recommender import engine
+from src.recommender.engine import RecommendationEngine, _patterns
+
+
+def _recommend(error_type, message, affected_resources=None):
+    """Run the engine on a single error and return its recommendations."""
+    error = Error(errorType=error_type, message=message, affectedResources=affected_resources or [])
+    RecommendationEngine([error]).generate_recommendations()
+    return error.recommendations
+
+
+def test_conflict_recommends_import_with_resource_address():
+    """Test that an existing resource gets an import command for its address."""
+    resource = AffectedResource(name="main", type="aws_s3_bucket", address="aws_s3_bucket.main")
+    recommendations = _recommend(ErrorType.RESOURCE_CONFLICT, "Bucket already exists", [resource])
+    
+    assert recommendations[0].code == "terraform import aws_s3_bucket.main <resource_id>"
+    assert recommendations[0].confidence == ConfidenceLevel.HIGH
+
+
+def test_state_mismatch_recommends_import_with_resource_address():
+    """Test that a state mismatch gets an import command for its address."""
+    resource = AffectedResource(name="web", type="aws_instance", address="aws_instance.web")
+    recommendations = _recommend(ErrorType.STATE_MISMATCH, "Resource has drifted", [resource])
+    
+    assert recommendations[1].code == "terraform import aws_instance.web <resource_id>"
+    assert recommendations[1].confidence == ConfidenceLevel.MEDIUM
+
+
+def test_probes_ignore_case():
+    """Test that keyword probes match regardless of case."""
+    recommendations = _recommend(ErrorType.PERMISSION, "AccessDenied for arn:AWS:iam::123:user/ci")
+    
+    assert any("AWS IAM" in rec.description for rec in recommendations)
+
+
+def test_first_matching_branch_rule_wins():
+    """Test that only the first matching rule contributes recommendations."""
+    recommendations = _recommend(ErrorType.PROVIDER, "Provider version mismatch in plugin binary")
+    descriptions = [rec.description for rec in recommendations]
+    
+    assert any("version constraint" in desc for desc in descriptions)
+    assert not any("Reinstall" in desc for desc in descriptions)
+
+
+def test_unclassified_error_gets_fallback_recommendations():
+    """Test that OTHER errors get the generic recommendations."""
+    recommendations = _recommend(ErrorType.OTHER, "Something went wrong")
+    
+    assert [rec.code for rec in recommendations] == [None, "terraform validate", None]
+
+
+def test_empty_message_gets_fallback_recommendations():
+    """Test that an error without a message skips its type's handler."""
+    recommendations = _recommend(ErrorType.VALIDATION, "")
+    
+    assert [rec.code for rec in recommendations] == [None, "terraform validate", None]
+
+
+def test_patterns_compile_on_first_probe():
+    """Test that regex probes are compiled lazily and only once."""
+    _patterns.cache_clear()
+    RecommendationEngine([]).generate_recommendations()
+    assert _patterns.cache_info().currsize == 0
+    
+    _recommend(ErrorType.DEPENDENCY, "unknown resource 'aws_vpc.main'")
+    _recommend(ErrorType.VALIDATION, "The value for 'ami' is invalid")
+    assert _patterns.cache_info().misses == 1
+
+
+def test_validation_probes_overlapping_field_and_expected():
+    """Test that an 'expected ' inside the quoted field name is still probed."""
+    recommendations = _recommend(ErrorType.VALIDATION, "The value for 'expected x' expected")
+    
+    assert recommendations[0].description == "Update expected x to match the expected format: x' expected"
+
+
+def test_large_batches_match_single_error_results(monkeypatch):
+    """Test that batches big enough for the thread pool keep per-error results."""
+    monkeypatch.setattr(engine, "_THREADS_RUN_IN_PARALLEL", True)
+    messages = ["Bucket already exists", "unknown resource 'aws_vpc.main'", "expected quote", ""]
+    types = [ErrorType.RESOURCE_CONFLICT, ErrorType.DEPENDENCY, ErrorType.SYNTAX, ErrorType.VALIDATION]
+    errors = [
+        Error(errorType=types[i % len(types)], message=messages[i % len(messages)])
+        for i in range(100)
+    ]
+    
+    RecommendationEngine(errors).generate_recommendations()
+    
+    for error in errors:
+        assert error.recommendations == _recommend(error.errorType, error.message)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])